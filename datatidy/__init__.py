@@ -27,12 +27,16 @@ Example:
     >>>     print("Fallback processing was used")
 """
 
-from .core import DataTidy
-from .config.parser import ConfigParser
-from .input.readers import DataReader
-from .fallback.processor import FallbackProcessor, ProcessingResult
-from .fallback.logger import EnhancedLogger, ProcessingMode, ErrorCategory
-from .fallback.metrics import DataQualityMetrics, DataQualityComparison
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .core import DataTidy
+    from .config.parser import ConfigParser
+    from .input.readers import DataReader
+    from .fallback.processor import FallbackProcessor, ProcessingResult
+    from .fallback.logger import EnhancedLogger, ProcessingMode, ErrorCategory
+    from .fallback.metrics import DataQualityMetrics, DataQualityComparison
 
 __version__ = "0.1.1"
 __all__ = [
@@ -47,3 +51,30 @@ __all__ = [
     "DataQualityMetrics",
     "DataQualityComparison",
 ]
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for ``datatidy version``, does not pull in pandas.
+_LAZY_IMPORTS = {
+    "DataTidy": ".core",
+    "ConfigParser": ".config.parser",
+    "DataReader": ".input.readers",
+    "FallbackProcessor": ".fallback.processor",
+    "ProcessingResult": ".fallback.processor",
+    "EnhancedLogger": ".fallback.logger",
+    "ProcessingMode": ".fallback.logger",
+    "ErrorCategory": ".fallback.logger",
+    "DataQualityMetrics": ".fallback.metrics",
+    "DataQualityComparison": ".fallback.metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
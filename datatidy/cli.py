@@ -2,8 +2,20 @@
 
 import argparse
 import sys
+from operator import itemgetter
 from pathlib import Path
-from .core import DataTidy
+
+# Processing summary fields shown by ``process --show-summary``, in print order
+_SUMMARY_FIELDS = itemgetter(
+    "processing_mode",
+    "success",
+    "processing_time",
+    "successful_columns",
+    "total_columns",
+    "failed_columns",
+    "skipped_columns",
+    "fallback_used",
+)
 
 
 def main() -> None:
@@ -61,20 +73,19 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    if args.command == "process":
-        process_command(args)
-    elif args.command == "validate":
-        validate_command(args)
-    elif args.command == "sample":
-        sample_command(args)
-    elif args.command == "version":
-        version_command()
-    else:
-        parser.print_help()
+    commands = {
+        "process": process_command,
+        "validate": validate_command,
+        "sample": sample_command,
+        "version": lambda _args: version_command(),
+    }
+    commands.get(args.command, lambda _args: parser.print_help())(args)
 
 
 def process_command(args: argparse.Namespace) -> None:
     """Handle process command."""
+    from .core import DataTidy
+
     try:
         # Initialize DataTidy
         datatidy = DataTidy()
@@ -113,21 +124,27 @@ def process_command(args: argparse.Namespace) -> None:
 
         # Show processing summary
         if args.show_summary or not result.success:
-            summary = datatidy.get_processing_summary()
+            (
+                mode,
+                success,
+                processing_time,
+                successful_columns,
+                total_columns,
+                failed_columns,
+                skipped_columns,
+                fallback_used,
+            ) = _SUMMARY_FIELDS(datatidy.get_processing_summary())
             print("\n📈 Processing Summary:")
-            print(f"   Mode: {summary['processing_mode']}")
-            print(f"   Success: {'✅' if summary['success'] else '❌'}")
-            print(f"   Processing time: {summary['processing_time']:.2f}s")
-            print(
-                f"   Successful columns: "
-                f"{summary['successful_columns']}/{summary['total_columns']}"
-            )
-
-            if summary["failed_columns"] > 0:
-                print(f"   Failed columns: {summary['failed_columns']}")
-            if summary["skipped_columns"] > 0:
-                print(f"   Skipped columns: {summary['skipped_columns']}")
-            if summary["fallback_used"]:
+            print(f"   Mode: {mode}")
+            print(f"   Success: {'✅' if success else '❌'}")
+            print(f"   Processing time: {processing_time:.2f}s")
+            print(f"   Successful columns: {successful_columns}/{total_columns}")
+
+            if failed_columns > 0:
+                print(f"   Failed columns: {failed_columns}")
+            if skipped_columns > 0:
+                print(f"   Skipped columns: {skipped_columns}")
+            if fallback_used:
                 print("   🔄 Fallback processing was used")
 
         # Show recommendations
@@ -170,6 +187,8 @@ def process_command(args: argparse.Namespace) -> None:
 
 def validate_command(args: argparse.Namespace) -> None:
     """Handle validate command."""
+    from .core import DataTidy
+
     try:
         datatidy = DataTidy()
         datatidy.load_config(args.config)
@@ -187,6 +206,8 @@ def validate_command(args: argparse.Namespace) -> None:
 
 def sample_command(args: argparse.Namespace) -> None:
     """Handle sample command."""
+    from .core import DataTidy
+
     try:
         output_path = Path(args.output)
 
@@ -2,9 +2,17 @@
 
 from typing import Any, Dict
 import yaml
-import jsonschema
 from .schema import ConfigSchema
 
+# Use the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Default validation rules applied to every output column
+_VALIDATION_DEFAULTS = {"required": True, "nullable": False}
+
 
 class ConfigParser:
     """Parser for YAML configuration files."""
@@ -17,8 +25,10 @@ class ConfigParser:
     def parse_file(self, config_path: str) -> Dict[str, Any]:
         """Parse configuration from YAML file."""
         try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
+            # Binary mode: the YAML reader decodes UTF-8 (or a BOM-marked
+            # UTF-16) itself, so Python does not decode the text first
+            with open(config_path, "rb") as file:
+                config = yaml.load(file, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax: {e}")
         except FileNotFoundError:
@@ -32,7 +42,7 @@ class ConfigParser:
     def parse_string(self, config_string: str) -> Dict[str, Any]:
         """Parse configuration from YAML string."""
         try:
-            config = yaml.safe_load(config_string)
+            config = yaml.load(config_string, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax: {e}")
 
@@ -50,10 +60,7 @@ class ConfigParser:
 
     def validate_config(self, config: Dict[str, Any]) -> None:
         """Validate configuration against schema."""
-        try:
-            jsonschema.validate(config, self.schema)
-        except jsonschema.ValidationError as e:
-            raise ValueError(f"Configuration validation error: {e.message}")
+        ConfigSchema.fast_validate(config)
 
     def _process_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Process and normalize configuration."""
@@ -67,17 +74,17 @@ class ConfigParser:
         # Process output columns
         output_columns = config["output"]["columns"]
         for column_name, column_config in output_columns.items():
-            # Set default column properties
-            column_config.setdefault("type", "string")
-            column_config.setdefault("source", column_name)
-
-            # Set default validation rules
-            if "validation" not in column_config:
-                column_config["validation"] = {}
-
-            validation = column_config["validation"]
-            validation.setdefault("required", True)
-            validation.setdefault("nullable", False)
+            # Merge over the defaults; explicit column settings take precedence
+            validation = {
+                **_VALIDATION_DEFAULTS,
+                **column_config.get("validation", {}),
+            }
+            output_columns[column_name] = {
+                "type": "string",
+                "source": column_name,
+                **column_config,
+                "validation": validation,
+            }
 
         # Process filters
         if "filters" in config["output"]:
@@ -1,5 +1,19 @@
 """JSON Schema definitions for configuration validation."""
 
+from typing import Any, Dict
+import jsonschema
+
+# Optional: compile the static schema into a specialised validation function
+try:
+    import fastjsonschema
+
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+# Names of inputs, output columns and similar mapping keys
+_IDENT_PATTERN = "^[a-zA-Z_][a-zA-Z0-9_]*$"
+
 INPUT_SOURCE_SCHEMA = {
     "type": "object",
     "required": ["type", "source"],
@@ -73,9 +87,7 @@ JOIN_SCHEMA = {
                 },
                 {
                     "type": "object",
-                    "patternProperties": {
-                        "^[a-zA-Z_][a-zA-Z0-9_]*$": {"type": "string"}
-                    },
+                    "patternProperties": {_IDENT_PATTERN: {"type": "string"}},
                 },
             ]
         },
@@ -104,9 +116,7 @@ CONFIG_SCHEMA = {
             "properties": {
                 "inputs": {
                     "type": "object",
-                    "patternProperties": {
-                        "^[a-zA-Z_][a-zA-Z0-9_]*$": INPUT_SOURCE_SCHEMA
-                    },
+                    "patternProperties": {_IDENT_PATTERN: INPUT_SOURCE_SCHEMA},
                     "minProperties": 1,
                 },
                 "joins": {"type": "array", "items": JOIN_SCHEMA},
@@ -117,7 +127,7 @@ CONFIG_SCHEMA = {
         "input": INPUT_SOURCE_SCHEMA,
         "inputs": {
             "type": "object",
-            "patternProperties": {"^[a-zA-Z_][a-zA-Z0-9_]*$": INPUT_SOURCE_SCHEMA},
+            "patternProperties": {_IDENT_PATTERN: INPUT_SOURCE_SCHEMA},
             "minProperties": 1,
         },
         "joins": {"type": "array", "items": JOIN_SCHEMA},
@@ -129,7 +139,7 @@ CONFIG_SCHEMA = {
                 "columns": {
                     "type": "object",
                     "patternProperties": {
-                        "^[a-zA-Z_][a-zA-Z0-9_]*$": {
+                        _IDENT_PATTERN: {
                             "type": "object",
                             "properties": {
                                 "source": {"type": "string"},
@@ -225,12 +235,26 @@ CONFIG_SCHEMA = {
                 "encoding": {"type": "string", "default": "utf-8"},
                 "show_execution_plan": {"type": "boolean", "default": False},
                 "verbose": {"type": "boolean", "default": False},
+                "parallel_input_loading": {"type": "boolean", "default": True},
             },
         },
     },
 }
 
 
+# Check the schema once at import and share one compiled validator
+jsonschema.Draft7Validator.check_schema(CONFIG_SCHEMA)
+_COMPILED_VALIDATOR = jsonschema.Draft7Validator(CONFIG_SCHEMA)
+
+# use_default=False keeps the schema's "default" keywords from being written
+# into the validated config, matching jsonschema's behaviour
+_FAST_VALIDATE = (
+    fastjsonschema.compile(CONFIG_SCHEMA, use_default=False)
+    if HAS_FASTJSONSCHEMA
+    else None
+)
+
+
 class ConfigSchema:
     """Configuration schema validator."""
 
@@ -238,3 +262,34 @@ class ConfigSchema:
     def get_schema() -> dict:
         """Get the configuration schema."""
         return CONFIG_SCHEMA
+
+    @staticmethod
+    def get_validator() -> jsonschema.Draft7Validator:
+        """Get the shared, precompiled validator for the configuration schema."""
+        return _COMPILED_VALIDATOR
+
+    @staticmethod
+    def fast_validate(config: Dict[str, Any]) -> None:
+        """Validate a configuration, raising ValueError if it is invalid.
+
+        Uses the fastjsonschema-compiled validator when fastjsonschema is
+        installed and the shared jsonschema validator otherwise. Invalid
+        configurations are always reported through jsonschema, so the error
+        message is the same with either backend.
+        """
+        fast_error = None
+        if _FAST_VALIDATE is not None:
+            try:
+                _FAST_VALIDATE(config)
+                return
+            except fastjsonschema.JsonSchemaException as e:
+                fast_error = e
+
+        # Report the most relevant error, as jsonschema.validate() does
+        error = jsonschema.exceptions.best_match(
+            _COMPILED_VALIDATOR.iter_errors(config)
+        )
+        if error is not None:
+            raise ValueError(f"Configuration validation error: {error.message}")
+        if fast_error is not None:
+            raise ValueError(f"Configuration validation error: {fast_error.message}")
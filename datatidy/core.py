@@ -1,14 +1,148 @@
 """Core DataTidy class for orchestrating data processing."""
 
-from typing import Any, Dict, Optional, Union, Callable, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, Callable, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import io
+import os
+import threading
 import pandas as pd
 from .config.parser import ConfigParser
-from .input.readers import DataReaderFactory
+from .input.readers import DatabaseReader, DataReaderFactory
 from .transformation.engine import TransformationEngine
 from .join_engine import JoinEngine
-from .fallback.processor import FallbackProcessor, ProcessingResult
-from .fallback.logger import EnhancedLogger, ProcessingMode
-from .fallback.metrics import DataQualityMetrics, DataQualityComparison
+
+# The fallback subpackage is imported on first use, so configs that are only
+# run through process_data() never load it
+if TYPE_CHECKING:
+    from .fallback.processor import FallbackProcessor, ProcessingResult
+    from .fallback.logger import EnhancedLogger, ProcessingMode
+    from .fallback.metrics import DataQualityComparison
+
+# Parsed and validated configurations, keyed on the parser and on either the
+# file path/mtime/size or the contents of a config dict, so repeated loads
+# skip parsing and schema validation. Entries are private copies; callers
+# always get their own copy.
+_CONFIG_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 32
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable, type-preserving key for a config value.
+
+    Types are kept alongside values so that e.g. ``1``/``True``/``1.0`` or a
+    list and a tuple never share a key. Raises TypeError for unhashable
+    leaf values.
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            frozenset((_freeze(k), _freeze(v)) for k, v in value.items()),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _cached_config(
+    key: Optional[Tuple[Any, ...]], load: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Return a copy of the config cached under ``key``, loading it if needed.
+
+    The cache is shared by every DataTidy instance, so it is only touched
+    under a lock; parsing and copying happen outside it.
+    """
+    if key is None:
+        return load()
+
+    with _CONFIG_CACHE_LOCK:
+        config = _CONFIG_CACHE.get(key)
+        if config is not None:
+            _CONFIG_CACHE.move_to_end(key)
+    if config is None:
+        loaded = load()
+        with _CONFIG_CACHE_LOCK:
+            # Another thread may have cached the same config meanwhile
+            config = _CONFIG_CACHE.setdefault(key, loaded)
+            _CONFIG_CACHE.move_to_end(key)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+
+# Upper bound on threads used to read multiple inputs concurrently
+_MAX_INPUT_WORKERS = 8
+
+# Rows per Parquet row group written by process_and_save
+_PARQUET_ROW_GROUP_SIZE = 65536
+
+
+def _write_parquet(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
+    """Write ``df`` to Parquet, in bounded row groups via pyarrow if available.
+
+    Keyword arguments are ``DataFrame.to_parquet`` options, so calls that
+    pass any are handed to pandas unchanged.
+    """
+    if not kwargs:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            pass
+        else:
+            table = pa.Table.from_pandas(df)
+            pq.write_table(table, path, row_group_size=_PARQUET_ROW_GROUP_SIZE)
+            return
+    df.to_parquet(path, **kwargs)
+
+
+def _write_excel(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
+    """Write ``df`` to Excel without the index.
+
+    pandas picks the Excel writer from the path suffix and only knows the
+    lower-case suffixes, so any other spelling is written with the writer for
+    the lower-cased suffix. The workbook is built in memory first, so an
+    existing file is left untouched if writing fails.
+    """
+    extension = _file_extension(path)
+    if path.endswith(extension):
+        df.to_excel(path, index=False, **kwargs)
+        return
+    kwargs.setdefault("engine", _EXCEL_ENGINES[extension])
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, **kwargs)
+    with open(path, "wb") as handle:
+        handle.write(buffer.getbuffer())
+
+
+def _file_extension(path: str) -> str:
+    """Return the lower-cased extension of ``path``, e.g. ``".csv"``."""
+    return os.path.splitext(path)[1].lower()
+
+
+# Writers pandas uses for each Excel extension, for paths it cannot infer from
+_EXCEL_ENGINES = {".xlsx": "openpyxl", ".xls": "xlwt"}
+
+_EXCEL_EXT = frozenset(_EXCEL_ENGINES)
+
+# process_and_save writers by output file extension; others are written as CSV
+_WRITERS: Dict[str, Callable[..., None]] = {
+    ".csv": lambda df, path, **kwargs: df.to_csv(path, index=False, **kwargs),
+    ".json": lambda df, path, **kwargs: df.to_json(path, **kwargs),
+    ".parquet": _write_parquet,
+    **dict.fromkeys(_EXCEL_EXT, _write_excel),
+}
+
+# Reader source types by input file extension
+_READER_TYPES = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pkl": "pickle",
+    **dict.fromkeys(_EXCEL_EXT, "excel"),
+}
 
 
 class DataTidy:
@@ -19,35 +153,105 @@ class DataTidy:
         self.config_parser = ConfigParser()
         self.config: Optional[Dict[str, Any]] = None
         self.transformation_engine: Optional[TransformationEngine] = None
-        self.fallback_processor: Optional[FallbackProcessor] = None
-        self.logger: Optional[EnhancedLogger] = None
-        self.last_processing_result: Optional[ProcessingResult] = None
+        self._fallback_processor: Optional["FallbackProcessor"] = None
+        self._logger: Optional["EnhancedLogger"] = None
+        self.last_processing_result: Optional["ProcessingResult"] = None
 
         if config:
             self.load_config(config)
 
     def load_config(self, config: Union[str, Dict[str, Any]]) -> None:
         """Load configuration from file path or dictionary."""
+        parser = self.config_parser
+        parser_key = (type(parser), parser.validate)
+
         if isinstance(config, str):
-            self.config = self.config_parser.parse_file(config)
+            path = config
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Missing files are left to the parser to report
+                file_key: Optional[Tuple[Any, ...]] = None
+            else:
+                file_key = (
+                    "file",
+                    os.path.abspath(path),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ) + parser_key
+            self.config = _cached_config(file_key, lambda: parser.parse_file(path))
         elif isinstance(config, dict):
-            self.config = self.config_parser.parse_dict(config)
+            config_dict = config
+            try:
+                dict_key: Optional[Tuple[Any, ...]] = (
+                    "dict",
+                    _freeze(config_dict),
+                ) + parser_key
+            except TypeError:
+                # Configs holding unhashable values are parsed uncached
+                dict_key = None
+            # Parse a copy so the caller's dict is never normalised in place
+            self.config = _cached_config(
+                dict_key, lambda: parser.parse_dict(copy.deepcopy(config_dict))
+            )
         else:
             raise ValueError("Config must be a file path string or dictionary")
 
-        # Initialize transformation engine with loaded config
+        # Initialize transformation engine with loaded config; the fallback
+        # processor and enhanced logger are created for it on first use
         self.transformation_engine = TransformationEngine(self.config)
-
-        # Initialize fallback processor and enhanced logger
-        self.logger = EnhancedLogger()
-        self.fallback_processor = FallbackProcessor(self.config, self.logger)
+        self._logger = None
+        self._fallback_processor = None
 
     def load_config_from_string(self, config_string: str) -> None:
         """Load configuration from YAML string."""
         self.config = self.config_parser.parse_string(config_string)
         self.transformation_engine = TransformationEngine(self.config)
-        self.logger = EnhancedLogger()
-        self.fallback_processor = FallbackProcessor(self.config, self.logger)
+        self._logger = None
+        self._fallback_processor = None
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: TransformationEngine,
+        logger: Optional["EnhancedLogger"] = None,
+    ) -> "DataTidy":
+        """Create a DataTidy instance around an existing transformation engine.
+
+        The engine's configuration is used as-is without being parsed again,
+        so one engine can back several instances (e.g. repeated benchmark runs).
+        """
+        instance = cls()
+        instance.config = engine.config
+        instance.transformation_engine = engine
+        instance.logger = logger
+        return instance
+
+    @property
+    def logger(self) -> Optional["EnhancedLogger"]:
+        """Get or create the enhanced logger once a configuration is loaded."""
+        if self._logger is None and self.config is not None:
+            from .fallback.logger import EnhancedLogger
+
+            self._logger = EnhancedLogger()
+        return self._logger
+
+    @logger.setter
+    def logger(self, logger: Optional["EnhancedLogger"]) -> None:
+        self._logger = logger
+
+    @property
+    def fallback_processor(self) -> Optional["FallbackProcessor"]:
+        """Get or create the fallback processor once a configuration is loaded."""
+        if self._fallback_processor is None and self.config is not None:
+            from .fallback.processor import FallbackProcessor
+
+            self._fallback_processor = FallbackProcessor(self.config, self.logger)
+        return self._fallback_processor
+
+    @fallback_processor.setter
+    def fallback_processor(self, processor: Optional["FallbackProcessor"]) -> None:
+        self._fallback_processor = processor
 
     def process_data(
         self, data: Optional[Union[str, pd.DataFrame]] = None
@@ -56,16 +260,7 @@ class DataTidy:
         if not self.config:
             raise ValueError("No configuration loaded. Call load_config() first.")
 
-        # Load input data if not provided
-        if data is None:
-            input_df = self._load_input_data()
-        elif isinstance(data, pd.DataFrame):
-            input_df = data
-        elif isinstance(data, str):
-            # Treat as file path and load according to config
-            input_df = self._load_data_from_path(data)
-        else:
-            raise ValueError("Data must be a pandas DataFrame, file path, or None")
+        input_df = self._resolve_input(data)
 
         # Apply transformations
         if not self.transformation_engine:
@@ -79,7 +274,7 @@ class DataTidy:
         self,
         data: Optional[Union[str, pd.DataFrame]] = None,
         fallback_query_func: Optional[Callable] = None,
-    ) -> ProcessingResult:
+    ) -> "ProcessingResult":
         """
         Process data with enhanced fallback capabilities.
 
@@ -93,15 +288,7 @@ class DataTidy:
         if not self.config:
             raise ValueError("No configuration loaded. Call load_config() first.")
 
-        # Load input data if not provided
-        if data is None:
-            input_df = self._load_input_data()
-        elif isinstance(data, pd.DataFrame):
-            input_df = data
-        elif isinstance(data, str):
-            input_df = self._load_data_from_path(data)
-        else:
-            raise ValueError("Data must be a pandas DataFrame, file path, or None")
+        input_df = self._resolve_input(data)
 
         # Process with fallback capabilities
         if not self.fallback_processor:
@@ -146,7 +333,9 @@ class DataTidy:
             return ["Initialize fallback processor first"]
         return self.fallback_processor.get_processing_recommendations()
 
-    def compare_with_fallback(self, fallback_df: pd.DataFrame) -> DataQualityComparison:
+    def compare_with_fallback(
+        self, fallback_df: pd.DataFrame
+    ) -> "DataQualityComparison":
         """
         Compare DataTidy results with fallback results.
 
@@ -159,6 +348,8 @@ class DataTidy:
         if not self.last_processing_result:
             raise ValueError("No DataTidy processing result available for comparison")
 
+        from .fallback.metrics import DataQualityMetrics
+
         return DataQualityMetrics.compare_results(
             self.last_processing_result.data,
             fallback_df,
@@ -173,8 +364,10 @@ class DataTidy:
         else:
             raise ValueError("Logger not initialized")
 
-    def set_processing_mode(self, mode: Union[str, ProcessingMode]):
+    def set_processing_mode(self, mode: Union[str, "ProcessingMode"]):
         """Set the processing mode for fallback processor."""
+        from .fallback.logger import ProcessingMode
+
         if isinstance(mode, str):
             mode = ProcessingMode(mode)
 
@@ -192,18 +385,9 @@ class DataTidy:
         """Process data and save to file."""
         result_df = self.process_data(data)
 
-        # Determine output format from file extension
-        if output_path.endswith(".csv"):
-            result_df.to_csv(output_path, index=False, **kwargs)
-        elif output_path.endswith((".xlsx", ".xls")):
-            result_df.to_excel(output_path, index=False, **kwargs)
-        elif output_path.endswith(".json"):
-            result_df.to_json(output_path, **kwargs)
-        elif output_path.endswith(".parquet"):
-            result_df.to_parquet(output_path, **kwargs)
-        else:
-            # Default to CSV
-            result_df.to_csv(output_path, index=False, **kwargs)
+        # Determine output format from file extension, defaulting to CSV
+        writer = _WRITERS.get(_file_extension(output_path), _WRITERS[".csv"])
+        writer(result_df, output_path, **kwargs)
 
     def get_errors(self) -> list:
         """Get processing errors from transformation engine."""
@@ -217,6 +401,26 @@ class DataTidy:
             return self.transformation_engine.has_errors()
         return False
 
+    def _resolve_input(self, data: Any) -> pd.DataFrame:
+        """Return the DataFrame to process for a ``process_data*`` argument.
+
+        ``None`` loads the configured input and a string is read as a file
+        path. Besides pandas DataFrames, any frame with a ``to_pandas()``
+        method (e.g. a pyarrow Table or polars DataFrame) is converted.
+        """
+        if data is None:
+            return self._load_input_data()
+        if isinstance(data, pd.DataFrame):
+            return data
+        if isinstance(data, str):
+            # Treat as file path and load according to config
+            return self._load_data_from_path(data)
+
+        to_pandas = getattr(data, "to_pandas", None)
+        if callable(to_pandas):
+            return to_pandas()
+        raise ValueError("Data must be a pandas DataFrame, file path, or None")
+
     def _load_input_data(self) -> pd.DataFrame:
         """Load input data based on configuration."""
         # Check if using new multi-input format
@@ -226,7 +430,11 @@ class DataTidy:
         # Single input (backward compatibility)
         if not self.config:
             raise ValueError("No configuration loaded")
-        input_config = self.config["input"]
+        return self._read_input(self.config["input"])
+
+    @staticmethod
+    def _read_input(input_config: Dict[str, Any]) -> pd.DataFrame:
+        """Read one input source described by an input configuration."""
         source_type = input_config["type"]
         source = input_config["source"]
 
@@ -234,14 +442,20 @@ class DataTidy:
         connection_string = input_config.get("connection_string")
         options = input_config.get("options", {})
 
-        # Create appropriate reader
-        reader = DataReaderFactory.get_reader(
-            source_type, connection_string=connection_string
-        )
+        # Get the (shared) reader for this source type and connection
+        reader = DataReaderFactory.get_reader_cached(source_type, connection_string)
 
         # Read data
         return reader.read(source, **options)
 
+    @staticmethod
+    def _is_database_input(input_config: Dict[str, Any]) -> bool:
+        """Check whether an input configuration is read from a database."""
+        reader = DataReaderFactory.get_reader_cached(
+            input_config["type"], input_config.get("connection_string")
+        )
+        return isinstance(reader, DatabaseReader)
+
     def _load_multi_input_data(self) -> pd.DataFrame:
         """Load and join multiple input sources."""
         if not self.config:
@@ -252,20 +466,34 @@ class DataTidy:
         # Initialize join engine
         join_engine = JoinEngine()
 
-        # Load all input datasets
-        for name, input_config in inputs_config.items():
-            source_type = input_config["type"]
-            source = input_config["source"]
-            connection_string = input_config.get("connection_string")
-            options = input_config.get("options", {})
-
-            # Create appropriate reader
-            reader = DataReaderFactory.get_reader(
-                source_type, connection_string=connection_string
-            )
+        # Load all input datasets. File inputs are independent and reading them
+        # is mostly I/O, so they are read on a thread pool unless
+        # global_settings.parallel_input_loading is false. Database inputs can
+        # share one engine and are always read one at a time on this thread
+        input_configs = list(inputs_config.values())
+        parallel = self.config.get("global_settings", {}).get(
+            "parallel_input_loading", True
+        )
+        from_database = [self._is_database_input(config) for config in input_configs]
+        file_count = from_database.count(False)
+        if parallel and file_count > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_INPUT_WORKERS, file_count)
+            ) as executor:
+                pending = {
+                    i: executor.submit(self._read_input, config)
+                    for i, config in enumerate(input_configs)
+                    if not from_database[i]
+                }
+                frames = [
+                    pending[i].result() if i in pending else self._read_input(config)
+                    for i, config in enumerate(input_configs)
+                ]
+        else:
+            frames = [self._read_input(config) for config in input_configs]
 
-            # Read data and add to join engine
-            df = reader.read(source, **options)
+        # Add to the join engine in configuration order
+        for name, df in zip(inputs_config, frames):
             join_engine.add_dataset(name, df)
 
         # Perform joins if specified
@@ -282,18 +510,11 @@ class DataTidy:
     def _load_data_from_path(self, file_path: str) -> pd.DataFrame:
         """Load data from file path using appropriate reader."""
         # Determine file type from extension
-        if file_path.endswith(".csv"):
-            source_type = "csv"
-        elif file_path.endswith((".xlsx", ".xls")):
-            source_type = "excel"
-        elif file_path.endswith(".parquet"):
-            source_type = "parquet"
-        elif file_path.endswith(".pkl"):
-            source_type = "pickle"
-        else:
+        source_type = _READER_TYPES.get(_file_extension(file_path))
+        if source_type is None:
             raise ValueError(f"Unsupported file type for path: {file_path}")
 
-        reader = DataReaderFactory.get_reader(source_type)
+        reader = DataReaderFactory.get_reader_cached(source_type)
         return reader.read(file_path)
 
     @staticmethod
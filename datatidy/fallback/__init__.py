@@ -1,7 +1,31 @@
 """Fallback processing module for robust data processing."""
 
-from .processor import FallbackProcessor
-from .logger import EnhancedLogger
-from .metrics import DataQualityMetrics
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .processor import FallbackProcessor
+    from .logger import EnhancedLogger
+    from .metrics import DataQualityMetrics
 
 __all__ = ["FallbackProcessor", "EnhancedLogger", "DataQualityMetrics"]
+
+# Submodules are imported on first attribute access (PEP 562), so using the
+# processor does not also load the metrics module
+_LAZY_IMPORTS = {
+    "FallbackProcessor": ".processor",
+    "EnhancedLogger": ".logger",
+    "DataQualityMetrics": ".metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
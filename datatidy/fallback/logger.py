@@ -2,13 +2,70 @@
 
 import logging
 import json
+import math
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional
 from enum import Enum
+import numpy as np
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # import pandas as pd  # Unused
 
 
+def _json_safe(value: Any) -> Any:
+    """Convert ``value`` the way orjson would for the standard json module.
+
+    Enums become their value, numpy scalars and arrays become Python objects
+    and non-finite floats become ``None``.
+    """
+    if isinstance(value, dict):
+        return {
+            (k.value if isinstance(k, Enum) else k): _json_safe(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, Enum):
+        return _json_safe(value.value)
+    if isinstance(value, (np.ndarray, np.generic)):
+        return _json_safe(value.tolist())
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def write_json_report(report: Dict[str, Any], file_path: str) -> None:
+    """Write a report dict to ``file_path`` as indented JSON.
+
+    Uses orjson when it is installed and the standard library otherwise, with
+    the same output either way: enums are written as their value, NaN and
+    infinity as ``null``, and other values JSON cannot represent (datetimes,
+    sets, ...) as ``str()``.
+    """
+    if HAS_ORJSON:
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    report,
+                    default=str,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+    else:
+        with open(file_path, "w") as f:
+            json.dump(_json_safe(report), f, indent=2, default=str)
+
+
 class ErrorCategory(Enum):
     """Categories of errors for better debugging."""
 
@@ -50,7 +107,13 @@ class EnhancedLogger:
 
         # Track errors and metrics
         self.error_log: List[Dict[str, Any]] = []
-        self.processing_metrics: Dict[str, Any] = {
+        self.processing_metrics: Dict[str, Any] = {}
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """Reset the error log and processing metrics for a new run."""
+        self.error_log = []
+        self.processing_metrics = {
             "start_time": None,
             "end_time": None,
             "processing_mode": None,
@@ -204,45 +267,27 @@ class EnhancedLogger:
         if not self.error_log:
             return {"total_errors": 0}
 
-        summary: Dict[str, Any] = {
-            "total_errors": len(self.error_log),
-            "by_category": {},
-            "by_column": {},
-            "most_common_errors": {},
-        }
+        by_category: DefaultDict[str, int] = defaultdict(int)
+        by_column: DefaultDict[str, int] = defaultdict(int)
+        most_common: DefaultDict[str, int] = defaultdict(int)
 
-        # Group by category
+        # Count by category, column and error type in a single pass
         for error in self.error_log:
-            category = error["category"]
-            column = error["column"]
-            error_type = error["error_type"]
-
-            # By category
-            by_category = summary["by_category"]
-            if category not in by_category:
-                by_category[category] = 0
-            by_category[category] += 1
-
-            # By column
-            by_column = summary["by_column"]
-            if column not in by_column:
-                by_column[column] = 0
-            by_column[column] += 1
-
-            # By error type
-            most_common = summary["most_common_errors"]
-            if error_type not in most_common:
-                most_common[error_type] = 0
-            most_common[error_type] += 1
-
-        return summary
+            by_category[error["category"]] += 1
+            by_column[error["column"]] += 1
+            most_common[error["error_type"]] += 1
+
+        return {
+            "total_errors": len(self.error_log),
+            "by_category": dict(by_category),
+            "by_column": dict(by_column),
+            "most_common_errors": dict(most_common),
+        }
 
     def export_error_log(self, file_path: str):
         """Export error log to JSON file."""
         report = self.get_error_report()
-
-        with open(file_path, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        write_json_report(report, file_path)
 
         self.logger.info(f"📁 Error report exported to: {file_path}")
 
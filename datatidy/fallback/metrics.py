@@ -318,10 +318,9 @@ class DataQualityMetrics:
                 for cm in comparison.column_metrics
             ]
 
-        import json
+        from .logger import write_json_report
 
-        with open(file_path, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        write_json_report(report, file_path)
 
     @staticmethod
     def print_comparison_summary(comparison: DataQualityComparison):
@@ -5,11 +5,15 @@ Fallback processor for robust data processing with partial processing capabiliti
 from typing import Any, Dict, List, Optional, Callable
 import pandas as pd
 from dataclasses import dataclass
+import sys
 import time
 from .logger import EnhancedLogger, ErrorCategory, ProcessingMode
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessingResult:
     """Result of data processing with detailed information."""
 
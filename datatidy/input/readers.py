@@ -1,7 +1,9 @@
 """Data readers for various input sources."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union, Type
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union, Type
 import pandas as pd
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -55,12 +57,18 @@ class ExcelReader(DataReader):
 
 
 class DatabaseReader(DataReader):
-    """Reader for database sources."""
+    """Reader for database sources.
+
+    A reader may be shared between threads: the engine is created once under
+    a lock, and SQLAlchemy engines hand each ``read_sql`` call its own pooled
+    connection.
+    """
 
     def __init__(self, connection_string: Optional[str] = None):
         """Initialize with optional connection string."""
         self.connection_string = connection_string
         self._engine: Optional[Engine] = None
+        self._engine_lock = threading.Lock()
 
     @property
     def engine(self) -> Engine:
@@ -68,7 +76,9 @@ class DatabaseReader(DataReader):
         if self._engine is None:
             if not self.connection_string:
                 raise ValueError("Connection string is required")
-            self._engine = create_engine(self.connection_string)
+            with self._engine_lock:
+                if self._engine is None:
+                    self._engine = create_engine(self.connection_string)
         return self._engine
 
     def read(self, source: Union[str, Dict[str, Any]], **kwargs: Any) -> pd.DataFrame:
@@ -148,6 +158,13 @@ class DataReaderFactory:
         "pickle": PickleReader,
     }
 
+    # Readers handed out by get_reader_cached, by (source type, connection),
+    # least recently used first. Bounded so that engines and credential-bearing
+    # connection strings for sources no longer in use are released.
+    _reader_cache: "OrderedDict[Tuple[str, Optional[str]], DataReader]" = OrderedDict()
+    _reader_cache_size = 16
+    _reader_cache_lock = threading.Lock()
+
     @classmethod
     def get_reader(cls, source_type: str, **kwargs: Any) -> DataReader:
         """Get appropriate reader for source type."""
@@ -165,7 +182,34 @@ class DataReaderFactory:
 
         return reader_class()  # type: ignore
 
+    @classmethod
+    def get_reader_cached(
+        cls, source_type: str, connection_string: Optional[str] = None
+    ) -> DataReader:
+        """Get a shared reader for the source type and connection string.
+
+        Repeated calls return the same reader, so a database reader keeps its
+        SQLAlchemy engine (and connection pool) across reads. Only the most
+        recently used readers are kept; the cache is safe to use from several
+        threads.
+        """
+        key = (source_type.lower(), connection_string)
+        with cls._reader_cache_lock:
+            reader = cls._reader_cache.get(key)
+            if reader is None:
+                reader = cls.get_reader(
+                    source_type, connection_string=connection_string
+                )
+                cls._reader_cache[key] = reader
+                if len(cls._reader_cache) > cls._reader_cache_size:
+                    cls._reader_cache.popitem(last=False)
+            else:
+                cls._reader_cache.move_to_end(key)
+        return reader
+
     @classmethod
     def register_reader(cls, source_type: str, reader_class: Type[DataReader]) -> None:
         """Register a new reader type."""
         cls._readers[source_type.lower()] = reader_class
+        with cls._reader_cache_lock:
+            cls._reader_cache.clear()
@@ -1,6 +1,7 @@
 """Main transformation engine for data processing."""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern
 import pandas as pd
 import re
 from .expressions import ExpressionParser
@@ -8,6 +9,12 @@ from .column_operations import AdvancedColumnTransformer
 from .dependency_resolver import ColumnExecutionEngine
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a validation regex once per distinct pattern string."""
+    return re.compile(pattern)
+
+
 class ValidationError(Exception):
     """Exception raised when data validation fails."""
 
@@ -290,7 +297,9 @@ class TransformationEngine:
             pattern = validation_rules["pattern"]
             string_series = series.astype(str)
             try:
-                invalid_mask = ~string_series.str.match(pattern, na=False)
+                invalid_mask = ~string_series.str.match(
+                    _compile_pattern(pattern), na=False
+                )
                 if invalid_mask.any():
                     invalid_indices = series[invalid_mask].index.tolist()
                     errors.append(
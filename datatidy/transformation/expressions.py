@@ -91,16 +91,14 @@ class SafeExpressionParser:
 
     def __init__(self):
         """Initialize the parser with safe functions and operators."""
-        pass
+        # Validated ASTs keyed by expression string; row-by-row evaluation
+        # parses the same expression once per row otherwise
+        self._compiled: Dict[str, ast.Expression] = {}
 
     def parse(self, expression: str, context: Dict[str, Any]) -> Any:
         """Parse and evaluate a safe expression."""
         try:
-            # Parse the expression into an AST
-            tree = ast.parse(expression, mode="eval")
-
-            # Validate the AST for safety
-            self._validate_ast(tree)
+            tree = self._compile(expression)
 
             # Evaluate the expression
             return self._eval_node(tree.body, context)
@@ -108,6 +106,18 @@ class SafeExpressionParser:
         except Exception as e:
             raise ValueError(f"Error parsing expression '{expression}': {str(e)}")
 
+    def _compile(self, expression: str) -> ast.Expression:
+        """Parse and validate an expression, reusing earlier results."""
+        tree = self._compiled.get(expression)
+        if tree is None:
+            # Parse the expression into an AST
+            tree = ast.parse(expression, mode="eval")
+
+            # Validate the AST for safety before caching it
+            self._validate_ast(tree)
+            self._compiled[expression] = tree
+        return tree
+
     def _validate_ast(self, node: ast.AST) -> None:
         """Validate AST for safe operations only."""
         for child in ast.walk(node):
@@ -3,9 +3,16 @@
 import unittest
 import tempfile
 import yaml
+from unittest.mock import patch
+from datatidy.config import schema
 from datatidy.config.parser import ConfigParser
 from datatidy.config.schema import ConfigSchema
 
+# Schema validation backends: fastjsonschema (when installed) and jsonschema
+BACKENDS = {"fastjsonschema": schema._FAST_VALIDATE, "jsonschema": None}
+if schema._FAST_VALIDATE is None:
+    del BACKENDS["fastjsonschema"]
+
 
 class TestConfigParser(unittest.TestCase):
     """Test cases for ConfigParser."""
@@ -73,14 +80,45 @@ class TestConfigParser(unittest.TestCase):
     def test_validate_config_valid(self):
         """Test validating valid configuration."""
         parser = ConfigParser()
-        # Should not raise exception
-        parser.validate_config(self.valid_config)
+        for backend, validate in BACKENDS.items():
+            with self.subTest(backend=backend), patch.object(
+                schema, "_FAST_VALIDATE", validate
+            ):
+                # Should not raise exception
+                parser.validate_config(self.valid_config)
 
     def test_validate_config_invalid(self):
         """Test validating invalid configuration."""
         parser = ConfigParser()
-        with self.assertRaises(ValueError):
-            parser.validate_config(self.invalid_config)
+        messages = set()
+        for backend, validate in BACKENDS.items():
+            with self.subTest(backend=backend), patch.object(
+                schema, "_FAST_VALIDATE", validate
+            ):
+                with self.assertRaises(ValueError) as context:
+                    parser.validate_config(self.invalid_config)
+                messages.add(str(context.exception))
+
+        # Both backends report the same error
+        self.assertEqual(len(messages), 1)
+
+    def test_validate_config_invalid_column(self):
+        """Test the error for an invalid column type names the bad value."""
+        config = {
+            "input": {"type": "csv", "source": "test.csv"},
+            "output": {"columns": {"test_col": {"type": "decimal"}}},
+        }
+        for backend, validate in BACKENDS.items():
+            with self.subTest(backend=backend), patch.object(
+                schema, "_FAST_VALIDATE", validate
+            ):
+                with self.assertRaises(ValueError) as context:
+                    ConfigSchema.fast_validate(config)
+                self.assertEqual(
+                    str(context.exception),
+                    "Configuration validation error: 'decimal' is not one of "
+                    "['string', 'int', 'float', 'bool', 'datetime']",
+                )
 
     def test_process_config_defaults(self):
         """Test config processing with defaults."""
@@ -1,12 +1,17 @@
 """Tests for the core DataTidy functionality."""
 
+import copy
 import unittest
 import pandas as pd
 import tempfile
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 from datatidy import DataTidy
+from datatidy import core
 from datatidy.core import DataTidy as DataTidyCore
 
 
@@ -67,6 +72,17 @@ class TestDataTidy(unittest.TestCase):
         self.assertIsNone(dt.config)
         self.assertIsNone(dt.transformation_engine)
 
+    def test_from_engine(self):
+        """Test building an instance around an existing engine."""
+        engine = DataTidy(self.sample_config).transformation_engine
+        dt = DataTidy.from_engine(engine)
+        self.assertIs(dt.transformation_engine, engine)
+        self.assertIs(dt.config, engine.config)
+        self.assertIs(dt.fallback_processor.logger, dt.logger)
+
+        result = dt.process_data(self.sample_data)
+        self.assertEqual(len(result), 4)
+
     def test_load_config_dict(self):
         """Test loading config from dictionary."""
         dt = DataTidy()
@@ -108,6 +124,164 @@ class TestDataTidy(unittest.TestCase):
         self.assertIsInstance(result, pd.DataFrame)
         self.assertGreater(len(result), 0)
 
+    def test_load_config_cached_copy(self):
+        """Test repeated loads of the same config return independent copies."""
+        same_config = copy.deepcopy(self.sample_config)
+
+        first = DataTidy()
+        first.load_config(self.sample_config)
+        first.config["global_settings"]["ignore_errors"] = False
+
+        second = DataTidy()
+        second.load_config(same_config)
+
+        self.assertTrue(second.config["global_settings"]["ignore_errors"])
+        self.assertIsNot(first.config, second.config)
+
+    def test_load_config_cache_concurrent(self):
+        """Test concurrent loads neither fail nor overfill the config cache."""
+        configs = []
+        for max_errors in range(core._CONFIG_CACHE_SIZE * 2):
+            config = copy.deepcopy(self.sample_config)
+            config["global_settings"]["max_errors"] = max_errors + 1
+            configs.append(config)
+        barrier = threading.Barrier(8)
+
+        def load_all(_):
+            barrier.wait()
+            return [
+                DataTidy(config).config["global_settings"]["max_errors"]
+                for config in configs
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(load_all, range(8)))
+
+        expected = list(range(1, len(configs) + 1))
+        self.assertTrue(all(result == expected for result in results))
+        self.assertLessEqual(len(core._CONFIG_CACHE), core._CONFIG_CACHE_SIZE)
+
+    def test_load_config_leaves_input_dict_unchanged(self):
+        """Test first loads and cache hits both leave the caller's dict alone."""
+        original = copy.deepcopy(self.sample_config)
+
+        for _ in range(2):
+            dt = DataTidy(self.sample_config)
+            self.assertEqual(self.sample_config, original)
+            self.assertIsNot(dt.config, self.sample_config)
+            self.assertIn("type", dt.config["output"]["columns"]["age_group"])
+
+    def test_load_config_file_reloaded_when_changed(self):
+        """Test a config file is parsed again after it is modified."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            temp_path = f.name
+
+        try:
+            DataTidy.create_sample_config(temp_path)
+            dt = DataTidy(temp_path)
+            self.assertEqual(dt.config["global_settings"]["max_errors"], 50)
+
+            with open(temp_path) as f:
+                content = f.read().replace("max_errors: 50", "max_errors: 7")
+            with open(temp_path, "w") as f:
+                f.write(content)
+            stat = os.stat(temp_path)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            dt.load_config(temp_path)
+            self.assertEqual(dt.config["global_settings"]["max_errors"], 7)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def test_load_multi_input_in_config_order(self):
+        """Test multiple inputs are loaded concurrently and kept in order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            users_path = os.path.join(temp_dir, "users.csv")
+            orders_path = os.path.join(temp_dir, "orders.csv")
+            self.sample_data.to_csv(users_path, index=False)
+            pd.DataFrame({"id": [1, 2, 2], "amount": [10, 20, 30]}).to_csv(
+                orders_path, index=False
+            )
+
+            config = {
+                "inputs": {
+                    "users": {"type": "csv", "source": users_path},
+                    "orders": {"type": "csv", "source": orders_path},
+                },
+                "joins": [
+                    {"left": "users", "right": "orders", "on": "id", "how": "inner"}
+                ],
+                "output": {"columns": {"amount": {"type": "int"}}},
+            }
+            for parallel in (True, False):
+                config["global_settings"] = {"parallel_input_loading": parallel}
+                df = DataTidy(copy.deepcopy(config))._load_input_data()
+                self.assertEqual(list(df["id"]), [1, 2, 2])
+                self.assertEqual(list(df["amount"]), [10, 20, 30])
+
+    def test_load_multi_input_threaded_failure(self):
+        """Test a failing input on the thread pool surfaces its error."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            users_path = os.path.join(temp_dir, "users.csv")
+            self.sample_data.to_csv(users_path, index=False)
+
+            config = {
+                "inputs": {
+                    "users": {"type": "csv", "source": users_path},
+                    "orders": {
+                        "type": "csv",
+                        "source": os.path.join(temp_dir, "missing.csv"),
+                    },
+                },
+                "joins": [
+                    {"left": "users", "right": "orders", "on": "id", "how": "inner"}
+                ],
+                "output": {"columns": {"id": {"type": "int"}}},
+                "global_settings": {"parallel_input_loading": True},
+            }
+            with self.assertRaises(FileNotFoundError):
+                DataTidy(config)._load_input_data()
+
+    def test_load_multi_input_database_sequential(self):
+        """Test database inputs are read on the calling thread."""
+        threads = {}
+
+        def fake_read(self, source, **kwargs):
+            threads[source] = threading.get_ident()
+            return pd.DataFrame({"id": [1, 2]})
+
+        config = {
+            "inputs": {
+                "a": {"type": "csv", "source": "a.csv"},
+                "b": {"type": "csv", "source": "b.csv"},
+                "c": {
+                    "type": "database",
+                    "source": "SELECT 1",
+                    "connection_string": "sqlite://",
+                },
+                "d": {
+                    "type": "database",
+                    "source": "SELECT 2",
+                    "connection_string": "sqlite://",
+                },
+            },
+            "joins": [
+                {"left": "a", "right": "b", "on": "id"},
+                {"left": "a", "right": "c", "on": "id"},
+                {"left": "a", "right": "d", "on": "id"},
+            ],
+            "output": {"columns": {"id": {"type": "int"}}},
+        }
+        with patch("datatidy.input.readers.CSVReader.read", fake_read), patch(
+            "datatidy.input.readers.DatabaseReader.read", fake_read
+        ):
+            DataTidy(config)._load_input_data()
+
+        self.assertEqual(threads["SELECT 1"], threading.get_ident())
+        self.assertEqual(threads["SELECT 2"], threading.get_ident())
+        self.assertEqual(len(threads), 4)
+
     def test_create_sample_config(self):
         """Test sample config creation."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
@@ -144,6 +318,77 @@ class TestDataTidy(unittest.TestCase):
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    def test_process_and_save_uppercase_extension(self):
+        """Test file extensions are matched case-insensitively."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "output.PARQUET")
+
+            dt = DataTidy(self.sample_config)
+            dt.process_and_save(temp_path, self.sample_data)
+
+            result_df = pd.read_parquet(temp_path)
+            self.assertIn("user_id", result_df.columns)
+            self.assertEqual(len(dt._load_data_from_path(temp_path)), 4)
+
+    def test_process_and_save_uppercase_excel_extension(self):
+        """Test upper-case Excel extensions behave like the lower-case ones."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dt = DataTidy(self.sample_config)
+            for name in ("output.XLSX", "output.Xlsx"):
+                temp_path = os.path.join(temp_dir, name)
+                dt.process_and_save(temp_path, self.sample_data)
+
+                result_df = pd.read_excel(temp_path, engine="openpyxl")
+                self.assertIn("user_id", result_df.columns)
+                self.assertEqual(len(result_df), 4)
+
+            # .xls needs a legacy writer; either way .XLS must not fall back
+            # to another format
+            outcomes = []
+            for name in ("output.xls", "output.XLS"):
+                temp_path = os.path.join(temp_dir, name)
+                try:
+                    dt.process_and_save(temp_path, self.sample_data)
+                except ValueError:
+                    outcomes.append("error")
+                    self.assertFalse(os.path.exists(temp_path))
+                else:
+                    outcomes.append("written")
+                    with open(temp_path, "rb") as f:
+                        self.assertNotEqual(f.read(7), b"user_id")
+            self.assertEqual(outcomes[0], outcomes[1])
+
+    def test_processing_summary_reflects_in_place_changes(self):
+        """Test the summary is recomputed from the current result and config."""
+        dt = DataTidy(self.sample_config)
+        result = dt.process_data_with_fallback(self.sample_data)
+        summary = dt.get_processing_summary()
+        self.assertEqual(summary["total_columns"], 3)
+
+        del dt.config["output"]["columns"]["age_group"]
+        result.successful_columns.append("extra")
+
+        summary = dt.get_processing_summary()
+        self.assertEqual(summary["total_columns"], 2)
+        self.assertEqual(summary["successful_columns"], len(result.successful_columns))
+
+    def test_process_data_to_pandas_input(self):
+        """Test frames with a to_pandas() method are accepted as input."""
+
+        class ArrowLikeTable:
+            def __init__(self, df):
+                self.df = df
+
+            def to_pandas(self):
+                return self.df
+
+        dt = DataTidy(self.sample_config)
+        result = dt.process_data(ArrowLikeTable(self.sample_data))
+        self.assertEqual(len(result), 4)
+
+        with self.assertRaises(ValueError):
+            dt.process_data(42)
+
     def test_get_config(self):
         """Test getting current configuration."""
         dt = DataTidy(self.sample_config)
@@ -95,6 +95,22 @@ class TestSafeExpressionParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.parser.parse("undefined_variable", {})
 
+    def test_parsed_expressions_are_reused(self):
+        """Test that repeated expressions are parsed and validated once."""
+        self.assertEqual(self.parser.parse("x + y", self.context), 15)
+        tree = self.parser._compiled["x + y"]
+
+        self.assertEqual(self.parser.parse("x + y", {"x": 1, "y": 2}), 3)
+        self.assertIs(self.parser._compiled["x + y"], tree)
+
+        # Rejected expressions keep being rejected on repeat calls
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.parser.parse("__import__('os')", {})
+            with self.assertRaises(ValueError):
+                self.parser.parse("invalid syntax [", {})
+        self.assertNotIn("invalid syntax [", self.parser._compiled)
+
 
 class TestExpressionParser(unittest.TestCase):
     """Test cases for ExpressionParser."""
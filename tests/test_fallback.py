@@ -186,6 +186,24 @@ class TestEnhancedLogger:
         assert metrics["failed_columns"] == 1
         assert metrics["processing_mode"] == "partial"
 
+    def test_reset_metrics(self):
+        """Test resetting clears errors and counters from the previous run."""
+        logger = EnhancedLogger()
+        logger.start_processing(ProcessingMode.PARTIAL, 2)
+        logger.log_column_success("col1")
+        logger.log_column_error(
+            "col2", ValueError("Test error"), ErrorCategory.VALIDATION_ERROR
+        )
+        previous_log = logger.error_log
+
+        logger.reset_metrics()
+
+        assert logger.error_log == []
+        assert len(previous_log) == 1
+        assert logger.processing_metrics["successful_columns"] == 0
+        assert logger.processing_metrics["failed_columns"] == 0
+        assert logger.processing_metrics["error_categories"] == {}
+
     def test_debugging_suggestions(self):
         """Test debugging suggestions generation."""
         logger = EnhancedLogger()
@@ -207,6 +225,57 @@ class TestEnhancedLogger:
         assert any("validation" in s.lower() for s in suggestions)
         assert any("transformation" in s.lower() for s in suggestions)
 
+    def test_export_error_log(self, tmp_path):
+        """Test the exported error report is valid JSON."""
+        import json
+
+        logger = EnhancedLogger()
+        logger.start_processing(ProcessingMode.PARTIAL, 2)
+        logger.log_column_error(
+            "col1", ValueError("Test error"), ErrorCategory.VALIDATION_ERROR
+        )
+        logger.end_processing(success=False)
+
+        report_path = tmp_path / "errors.json"
+        logger.export_error_log(str(report_path))
+
+        report = json.loads(report_path.read_text())
+        assert report["error_summary"]["total_errors"] == 1
+        assert report["error_summary"]["by_column"] == {"col1": 1}
+        assert report["error_log"][0]["column"] == "col1"
+        assert isinstance(report["processing_metrics"]["start_time"], str)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_write_json_report_backends(self, tmp_path, monkeypatch, use_orjson):
+        """Test orjson and the json fallback write the same report."""
+        import json
+        from datetime import datetime
+        from datatidy.fallback import logger as logger_module
+
+        if use_orjson and not logger_module.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(logger_module, "HAS_ORJSON", use_orjson)
+
+        report = {
+            "mode": ProcessingMode.PARTIAL,
+            "by_category": {ErrorCategory.INPUT_ERROR: 2},
+            "scores": [1.5, float("nan"), float("inf"), np.float64("nan")],
+            "count": np.int64(3),
+            "values": np.array([1.0, np.nan]),
+            "started": datetime(2024, 1, 1),
+        }
+        report_path = tmp_path / "report.json"
+        logger_module.write_json_report(report, str(report_path))
+
+        assert json.loads(report_path.read_text()) == {
+            "mode": "partial",
+            "by_category": {"input_error": 2},
+            "scores": [1.5, None, None, None],
+            "count": 3,
+            "values": [1.0, None],
+            "started": "2024-01-01 00:00:00",
+        }
+
 
 class TestDataQualityMetrics:
     """Test data quality metrics and comparison."""
@@ -4,6 +4,8 @@ import unittest
 import pandas as pd
 import tempfile
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -145,6 +147,11 @@ class TestDatabaseReader(unittest.TestCase):
 class TestDataReaderFactory(unittest.TestCase):
     """Test cases for DataReaderFactory."""
 
+    def setUp(self):
+        """Start each test with an empty shared reader cache."""
+        DataReaderFactory._reader_cache.clear()
+        self.addCleanup(DataReaderFactory._reader_cache.clear)
+
     def test_get_csv_reader(self):
         """Test getting CSV reader."""
         reader = DataReaderFactory.get_reader("csv")
@@ -168,6 +175,59 @@ class TestDataReaderFactory(unittest.TestCase):
         )
         self.assertIsInstance(reader, DatabaseReader)
 
+    def test_get_reader_cached(self):
+        """Test cached readers are shared per type and connection string."""
+        reader = DataReaderFactory.get_reader_cached("csv")
+        self.assertIsInstance(reader, CSVReader)
+        self.assertIs(DataReaderFactory.get_reader_cached("CSV"), reader)
+
+        db_reader = DataReaderFactory.get_reader_cached("postgres", "postgresql://a")
+        self.assertIs(
+            DataReaderFactory.get_reader_cached("postgres", "postgresql://a"),
+            db_reader,
+        )
+        self.assertIsNot(
+            DataReaderFactory.get_reader_cached("postgres", "postgresql://b"),
+            db_reader,
+        )
+
+    def test_get_reader_cached_is_bounded(self):
+        """Test least recently used readers are evicted past the cache size."""
+        size = DataReaderFactory._reader_cache_size
+        first = DataReaderFactory.get_reader_cached("postgres", "postgresql://keep")
+        for i in range(size):
+            DataReaderFactory.get_reader_cached("postgres", f"postgresql://{i}")
+            # Touch the first reader so it stays most recently used
+            DataReaderFactory.get_reader_cached("postgres", "postgresql://keep")
+
+        self.assertLessEqual(len(DataReaderFactory._reader_cache), size)
+        self.assertIs(
+            DataReaderFactory.get_reader_cached("postgres", "postgresql://keep"),
+            first,
+        )
+        self.assertNotIn(
+            ("postgres", "postgresql://0"), DataReaderFactory._reader_cache
+        )
+
+    @patch("datatidy.input.readers.create_engine")
+    def test_get_reader_cached_shared_across_threads(self, mock_create_engine):
+        """Test threads share one database reader and create one engine."""
+        barrier = threading.Barrier(8)
+
+        def get_engine(_):
+            barrier.wait()
+            reader = DataReaderFactory.get_reader_cached(
+                "postgres", "postgresql://threads"
+            )
+            return reader, reader.engine
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(get_engine, range(8)))
+
+        self.assertEqual(len({id(reader) for reader, _ in results}), 1)
+        self.assertEqual(len({id(engine) for _, engine in results}), 1)
+        mock_create_engine.assert_called_once_with("postgresql://threads")
+
     def test_unsupported_type(self):
         """Test error for unsupported reader type."""
         with self.assertRaises(ValueError):
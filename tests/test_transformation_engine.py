@@ -1,8 +1,11 @@
 """Tests for transformation engine."""
 
+import json
 import unittest
 import pandas as pd
 import numpy as np
+import yaml
+from datatidy.config.parser import ConfigParser
 from datatidy.transformation.engine import TransformationEngine, ValidationError
 
 
@@ -264,6 +267,35 @@ class TestValidationRules(unittest.TestCase):
         error_messages = [error["message"] for error in errors]
         self.assertTrue(any("pattern" in msg for msg in error_messages))
 
+    def test_pattern_validation_keeps_config_serializable(self):
+        """Test pattern validation leaves the parsed config as plain data."""
+        config = ConfigParser().parse_dict(
+            {
+                "input": {"type": "csv", "source": "codes.csv"},
+                "output": {
+                    "columns": {
+                        "code": {
+                            "type": "string",
+                            "validation": {"pattern": r"^[A-Z]{2}\d{3}$"},
+                        }
+                    }
+                },
+                "global_settings": {"ignore_errors": True},
+            }
+        )
+
+        engine = TransformationEngine(config)
+        engine.transform(pd.DataFrame({"code": ["AB123", "invalid"]}))
+        self.assertTrue(any("pattern" in e["message"] for e in engine.get_errors()))
+
+        # Editing the pattern takes effect on the next run
+        config["output"]["columns"]["code"]["validation"]["pattern"] = r"^\w+$"
+        engine.transform(pd.DataFrame({"code": ["AB123", "invalid"]}))
+        self.assertFalse(engine.has_errors())
+
+        json.dumps(config)
+        yaml.safe_dump(config)
+
     def test_allowed_values_validation(self):
         """Test allowed values validation."""
         config = {